@@ -1,11 +1,15 @@
+import logging
+
 from ....api.context import Context
 from ....db import paginate, models
 
+log = logging.getLogger(__name__)
+
 
 def list_user_activities(context: Context, source, filter: dict = None):
     if not filter:
         filter = {}
-    print('filter = ', filter)
+    log.debug('list_user_activities filter=%s', filter)
     with context.engine.scoped_session() as session:
         q = (
             session.query(models.Activity)
@@ -1,9 +1,6 @@
 import json
 import logging
 
-from botocore.config import Config
-from botocore.exceptions import ClientError
-
 from ..Stack import stack_helper
 from .... import db
 from ....api.constants import (
@@ -14,6 +11,7 @@ from ....aws.handlers.glue import Glue
 from ....aws.handlers.service_handlers import Worker
 from ....aws.handlers.sts import SessionHelper
 from ....aws.handlers.kms import KMS
+from ....aws.handlers.s3 import S3
 
 from ....aws.handlers.quicksight import Quicksight
 from ....db import paginate, exceptions, permissions, models
@@ -158,24 +156,14 @@ def get_file_upload_presigned_url(
     with context.engine.scoped_session() as session:
         dataset = Dataset.get_dataset_by_uri(session, datasetUri)
 
-    s3_client = SessionHelper.remote_session(dataset.AwsAccountId).client(
-        's3',
-        region_name=dataset.region,
-        config=Config(signature_version='s3v4', s3={'addressing_style': 'virtual'}),
+    response = S3.get_presigned_post(
+        account_id=dataset.AwsAccountId,
+        region=dataset.region,
+        bucket_name=dataset.S3BucketName,
+        key=input.get('prefix', 'uploads') + '/' + input.get('fileName'),
+        expires_in=15 * 60,
     )
-    try:
-        s3_client.get_bucket_acl(
-            Bucket=dataset.S3BucketName, ExpectedBucketOwner=dataset.AwsAccountId
-        )
-        response = s3_client.generate_presigned_post(
-            Bucket=dataset.S3BucketName,
-            Key=input.get('prefix', 'uploads') + '/' + input.get('fileName'),
-            ExpiresIn=15 * 60,
-        )
-
-        return json.dumps(response)
-    except ClientError as e:
-        raise e
+    return json.dumps(response)
 
 
 def list_datasets(context: Context, source, filter: dict = None):
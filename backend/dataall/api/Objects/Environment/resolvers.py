@@ -27,7 +27,7 @@ log = logging.getLogger()
 
 def get_trust_account(context: Context, source, **kwargs):
     current_account = SessionHelper.get_account()
-    print('current_account  = ', current_account)
+    log.debug('get_trust_account current_account=%s', current_account)
     return current_account
 
 
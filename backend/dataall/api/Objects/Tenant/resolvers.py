@@ -1,4 +1,7 @@
+import json
+import logging
 import os
+import time
 
 from .... import db
 from ....aws.handlers.sts import SessionHelper
@@ -6,10 +9,39 @@ from ....aws.handlers.parameter_store import ParameterStoreManager
 from ....aws.handlers.quicksight import Quicksight
 from ....db import exceptions
 
+log = logging.getLogger(__name__)
+
+ENVNAME = os.getenv('envname', 'local')
+REGION = os.getenv('AWS_REGION', 'eu-west-1')
+
+# Tenant permissions and groups are read on most admin page loads and rarely change,
+# results are kept per caller for a short time and dropped on every permission update
+TENANT_CACHE_TTL_SECONDS = 30
+TENANT_CACHE_MAX_SIZE = 1024
+_tenant_cache = {}
+
+
+def _cached_tenant_query(context, name, query, filter=None):
+    key = (
+        name,
+        context.username,
+        tuple(sorted(context.groups or [])),
+        json.dumps(filter, sort_keys=True),
+    )
+    now = time.monotonic()
+    cached = _tenant_cache.get(key)
+    if cached and now - cached[1] < TENANT_CACHE_TTL_SECONDS:
+        return cached[0]
+    result = query()
+    if len(_tenant_cache) >= TENANT_CACHE_MAX_SIZE:
+        _tenant_cache.clear()
+    _tenant_cache[key] = (result, now)
+    return result
+
 
 def update_group_permissions(context, source, input=None):
     with context.engine.scoped_session() as session:
-        return db.api.TenantPolicy.update_group_permissions(
+        updated = db.api.TenantPolicy.update_group_permissions(
             session=session,
             username=context.username,
             groups=context.groups,
@@ -17,42 +49,48 @@ def update_group_permissions(context, source, input=None):
             data=input,
             check_perm=True,
         )
+    _tenant_cache.clear()
+    return updated
 
 
 def list_tenant_permissions(context, source):
-    with context.engine.scoped_session() as session:
-        return db.api.TenantPolicy.list_tenant_permissions(
-            session=session, username=context.username, groups=context.groups
-        )
+    def query():
+        with context.engine.scoped_session() as session:
+            return db.api.TenantPolicy.list_tenant_permissions(
+                session=session, username=context.username, groups=context.groups
+            )
+
+    return _cached_tenant_query(context, 'list_tenant_permissions', query)
 
 
 def list_tenant_groups(context, source, filter=None):
     if not filter:
         filter = {}
-    with context.engine.scoped_session() as session:
-        return db.api.TenantPolicy.list_tenant_groups(
-            session=session,
-            username=context.username,
-            groups=context.groups,
-            uri=None,
-            data=filter,
-            check_perm=True,
-        )
+
+    def query():
+        with context.engine.scoped_session() as session:
+            return db.api.TenantPolicy.list_tenant_groups(
+                session=session,
+                username=context.username,
+                groups=context.groups,
+                uri=None,
+                data=filter,
+                check_perm=True,
+            )
+
+    return _cached_tenant_query(context, 'list_tenant_groups', query, filter)
 
 
 def update_ssm_parameter(context, source, name: str = None, value: str = None):
+    log.debug('update_ssm_parameter name=%s value=%s', name, value)
     current_account = SessionHelper.get_account()
-    region = os.getenv('AWS_REGION', 'eu-west-1')
-    print(value)
-    print(name)
-    response = ParameterStoreManager.update_parameter(AwsAccountId=current_account, region=region, parameter_name=f'/dataall/{os.getenv("envname", "local")}/quicksightmonitoring/{name}', parameter_value=value)
+    response = ParameterStoreManager.update_parameter(AwsAccountId=current_account, region=REGION, parameter_name=f'/dataall/{ENVNAME}/quicksightmonitoring/{name}', parameter_value=value)
     return response
 
 
 def get_monitoring_dashboard_id(context, source):
     current_account = SessionHelper.get_account()
-    region = os.getenv('AWS_REGION', 'eu-west-1')
-    dashboard_id = ParameterStoreManager.get_parameter_value(AwsAccountId=current_account, region=region, parameter_path=f'/dataall/{os.getenv("envname", "local")}/quicksightmonitoring/DashboardId')
+    dashboard_id = ParameterStoreManager.get_parameter_value(AwsAccountId=current_account, region=REGION, parameter_path=f'/dataall/{ENVNAME}/quicksightmonitoring/DashboardId')
     if not dashboard_id:
         raise exceptions.AWSResourceNotFound(
             action='GET_DASHBOARD_ID',
@@ -63,8 +101,7 @@ def get_monitoring_dashboard_id(context, source):
 
 def get_monitoring_vpc_connection_id(context, source):
     current_account = SessionHelper.get_account()
-    region = os.getenv('AWS_REGION', 'eu-west-1')
-    vpc_connection_id = ParameterStoreManager.get_parameter_value(AwsAccountId=current_account, region=region, parameter_path=f'/dataall/{os.getenv("envname", "local")}/quicksightmonitoring/VPCConnectionId')
+    vpc_connection_id = ParameterStoreManager.get_parameter_value(AwsAccountId=current_account, region=REGION, parameter_path=f'/dataall/{ENVNAME}/quicksightmonitoring/VPCConnectionId')
     if not vpc_connection_id:
         raise exceptions.AWSResourceNotFound(
             action='GET_VPC_CONNECTION_ID',
@@ -75,12 +112,11 @@ def get_monitoring_vpc_connection_id(context, source):
 
 def create_quicksight_data_source_set(context, source, vpcConnectionId: str = None):
     current_account = SessionHelper.get_account()
-    region = os.getenv('AWS_REGION', 'eu-west-1')
     user = Quicksight.register_user_in_group(AwsAccountId=current_account, UserName=context.username, GroupName='dataall', UserRole='AUTHOR')
 
-    datasourceId = Quicksight.create_data_source_vpc(AwsAccountId=current_account, region=region, UserName=context.username, vpcConnectionId=vpcConnectionId)
+    datasourceId = Quicksight.create_data_source_vpc(AwsAccountId=current_account, region=REGION, UserName=context.username, vpcConnectionId=vpcConnectionId)
     # Data sets are not created programmatically. Too much overhead for the value added. However, an example API is provided:
-    # datasets = Quicksight.create_data_set_from_source(AwsAccountId=current_account, region=region, UserName='dataallTenantUser', dataSourceId=datasourceId, tablesToImport=['organization', 'environment', 'dataset', 'datapipeline', 'dashboard', 'share_object'])
+    # datasets = Quicksight.create_data_set_from_source(AwsAccountId=current_account, region=REGION, UserName='dataallTenantUser', dataSourceId=datasourceId, tablesToImport=['organization', 'environment', 'dataset', 'datapipeline', 'dashboard', 'share_object'])
 
     return datasourceId
 
@@ -95,11 +131,10 @@ def get_quicksight_author_session(context, source, awsAccount: str = None):
                 action=db.permissions.TENANT_ALL,
                 tenant_name=context.username,
             )
-        region = os.getenv('AWS_REGION', 'eu-west-1')
 
         url = Quicksight.get_author_session(
             AwsAccountId=awsAccount,
-            region=region,
+            region=REGION,
             UserName=context.username,
             UserRole='AUTHOR',
         )
@@ -118,12 +153,11 @@ def get_quicksight_reader_session(context, source, dashboardId: str = None):
                 tenant_name=context.username,
             )
 
-        region = os.getenv('AWS_REGION', 'eu-west-1')
         current_account = SessionHelper.get_account()
 
         url = Quicksight.get_reader_session(
             AwsAccountId=current_account,
-            region=region,
+            region=REGION,
             UserName=context.username,
             UserRole='READER',
             DashboardId=dashboardId
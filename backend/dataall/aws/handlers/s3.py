@@ -1,4 +1,9 @@
+import atexit
 import logging
+import threading
+from datetime import datetime, timedelta, timezone
+
+from botocore.config import Config
 
 from ... import db
 from ...db import models
@@ -7,6 +12,46 @@ from .sts import SessionHelper
 
 log = logging.getLogger(__name__)
 
+# Clients on remote accounts sign with assumed-role credentials, they are dropped
+# early enough that the longest presigned request they sign stays valid
+PRESIGN_MAX_EXPIRES_IN = timedelta(minutes=15)
+_CLIENT_CREDENTIALS_MARGIN = timedelta(minutes=5)
+_CLIENT_CONFIG = Config(max_pool_connections=50, retries={'mode': 'adaptive'})
+_PRESIGN_CONFIG = Config(signature_version='s3v4', s3={'addressing_style': 'virtual'})
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _cached_client(account_id: str, region: str, client_type: str, config: Config = None):
+    key = (account_id, region, client_type, config)
+    with _clients_lock:
+        cached = _clients.get(key)
+    if cached and (cached[1] is None or datetime.now(timezone.utc) < cached[1]):
+        return cached[0]
+
+    # Built outside the lock: sessions are not shared, and creating them may call STS/SSM
+    if account_id:
+        credentials = SessionHelper.remote_credentials(accountid=account_id)
+        session = SessionHelper.get_session_from_credentials(credentials)
+        expires_at = credentials['Expiration'] - PRESIGN_MAX_EXPIRES_IN - _CLIENT_CREDENTIALS_MARGIN
+    else:
+        # the default credentials chain refreshes its own credentials
+        session = SessionHelper.get_session()
+        expires_at = None
+    client_config = _CLIENT_CONFIG.merge(config) if config else _CLIENT_CONFIG
+    client = session.client(client_type, region_name=region, config=client_config)
+    with _clients_lock:
+        _clients[key] = (client, expires_at)
+    return client
+
+
+@atexit.register
+def _close_clients():
+    with _clients_lock:
+        for client, _ in _clients.values():
+            client.close()
+        _clients.clear()
+
 
 class S3:
     @staticmethod
@@ -20,9 +65,8 @@ class S3:
             return location
 
     @staticmethod
-    def client(account_id: str, region: str, client_type: str):
-        session = SessionHelper.remote_session(accountid=account_id)
-        return session.client(client_type, region_name=region)
+    def client(account_id: str, region: str, client_type: str, config: Config = None):
+        return _cached_client(account_id, region, client_type, config)
 
     @staticmethod
     def create_bucket_prefix(location):
@@ -155,6 +199,24 @@ class S3:
             )
             raise e
 
+    @staticmethod
+    def get_presigned_post(account_id: str, region: str, bucket_name: str, key: str, expires_in: int):
+        if expires_in > PRESIGN_MAX_EXPIRES_IN.total_seconds():
+            raise ValueError(f'expires_in must not exceed {PRESIGN_MAX_EXPIRES_IN.total_seconds():.0f} seconds')
+        try:
+            s3cli = S3.client(account_id=account_id, region=region, client_type='s3', config=_PRESIGN_CONFIG)
+            s3cli.get_bucket_acl(Bucket=bucket_name, ExpectedBucketOwner=account_id)
+            return s3cli.generate_presigned_post(
+                Bucket=bucket_name,
+                Key=key,
+                ExpiresIn=expires_in,
+            )
+        except Exception as e:
+            log.error(
+                f'Failed to generate presigned post for {key} on bucket {bucket_name} of {account_id} : {e}'
+            )
+            raise e
+
     @staticmethod
     def generate_access_point_policy_template(
         principal_id: str,
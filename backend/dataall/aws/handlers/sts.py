@@ -1,7 +1,10 @@
 import json
 import logging
 import os
+import threading
 import urllib
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 import boto3
 from botocore.client import Config
@@ -19,6 +22,12 @@ except ImportError:
 
 log = logging.getLogger(__name__)
 
+# Assumed-role credentials are reused by remote_session while they stay valid for at
+# least this long, callers building long-lived clients on top of them rely on it
+REMOTE_CREDENTIALS_MIN_VALIDITY = timedelta(minutes=30)
+_remote_credentials = {}
+_remote_credentials_lock = threading.Lock()
+
 
 class SessionHelper:
     """SessionHelpers is a class simplifying common aws boto3 session tasks and helpers"""
@@ -35,39 +44,53 @@ class SessionHelper:
                     If role_arn is provided, base_session should be a boto3 session on the aws accountid is defined
         """
         if role_arn:
-            external_id_secret = cls.get_external_id_secret()
-            if external_id_secret:
-                assume_role_dict = dict(
-                    RoleArn=role_arn,
-                    RoleSessionName=role_arn.split('/')[1],
-                    ExternalId=external_id_secret,
-                )
-            else:
-                assume_role_dict = dict(
-                    RoleArn=role_arn,
-                    RoleSessionName=role_arn.split('/')[1],
-                )
-            try:
-                region = os.getenv('AWS_REGION', 'eu-west-1')
-                sts = base_session.client(
-                    'sts',
-                    config=Config(user_agent_extra=f'{__pkg_name__}/{__version__}'),
-                    region_name=region,
-                    endpoint_url=f"https://sts.{region}.amazonaws.com"
-                )
-                response = sts.assume_role(**assume_role_dict)
-                return boto3.Session(
-                    aws_access_key_id=response['Credentials']['AccessKeyId'],
-                    aws_secret_access_key=response['Credentials']['SecretAccessKey'],
-                    aws_session_token=response['Credentials']['SessionToken'],
-                )
-            except ClientError as e:
-                log.error(f'Failed to assume role {role_arn} due to: {e} ')
-                raise e
-
+            return cls.get_session_from_credentials(cls._assume_role(base_session, role_arn))
         else:
             return boto3.Session()
 
+    @classmethod
+    def _assume_role(cls, base_session, role_arn):
+        """Assumes role_arn from base_session and returns the sts Credentials, including their Expiration"""
+        external_id_secret = cls.get_external_id_secret()
+        if external_id_secret:
+            assume_role_dict = dict(
+                RoleArn=role_arn,
+                RoleSessionName=role_arn.split('/')[1],
+                ExternalId=external_id_secret,
+            )
+        else:
+            assume_role_dict = dict(
+                RoleArn=role_arn,
+                RoleSessionName=role_arn.split('/')[1],
+            )
+        try:
+            region = os.getenv('AWS_REGION', 'eu-west-1')
+            sts = base_session.client(
+                'sts',
+                config=Config(user_agent_extra=f'{__pkg_name__}/{__version__}'),
+                region_name=region,
+                endpoint_url=f"https://sts.{region}.amazonaws.com"
+            )
+            response = sts.assume_role(**assume_role_dict)
+            return response['Credentials']
+        except ClientError as e:
+            log.error(f'Failed to assume role {role_arn} due to: {e} ')
+            raise e
+
+    @staticmethod
+    def get_session_from_credentials(credentials):
+        """Returns a new boto3 session signing with the provided sts Credentials
+        Args:
+            credentials(dict) : Credentials as returned by sts:AssumeRole
+        Returns:
+            boto3.session.Session : a boto3 session
+        """
+        return boto3.Session(
+            aws_access_key_id=credentials['AccessKeyId'],
+            aws_secret_access_key=credentials['SecretAccessKey'],
+            aws_session_token=credentials['SessionToken'],
+        )
+
     @classmethod
     def _get_parameter_value(cls, parameter_path=None):
         """
@@ -196,14 +219,36 @@ class SessionHelper:
         return response['Role']['RoleId']
 
     @classmethod
-    def remote_session(cls, accountid, role=None):
+    def remote_session(cls, accountid, role=None, use_cache=True):
         """Creates a remote boto3 session on the remote AWS account , assuming the delegation Role
         Args:
             accountid(string) : aws account id
             role(string) : arn of the IAM role to assume in the boto3 session
+            use_cache(bool) : reuse cached credentials, set to False when handing them to long running processes
         Returns :
             boto3.session.Session: boto3 Session, on the target aws accountid, assuming the delegation role or a provided role
         """
+        credentials = cls.remote_credentials(accountid=accountid, role=role, use_cache=use_cache)
+        return cls.get_session_from_credentials(credentials)
+
+    @classmethod
+    def remote_credentials(cls, accountid, role=None, use_cache=True):
+        """Returns sts Credentials on the remote AWS account, assuming the delegation Role or a provided role.
+        Credentials are cached per account and role and reused while they remain valid
+        for at least REMOTE_CREDENTIALS_MIN_VALIDITY
+        Args:
+            accountid(string) : aws account id
+            role(string) : arn of the IAM role to assume
+            use_cache(bool) : reuse cached credentials
+        Returns :
+            dict: Credentials as returned by sts:AssumeRole, including their Expiration
+        """
+        key = (accountid, role)
+        if use_cache:
+            with _remote_credentials_lock:
+                credentials = _remote_credentials.get(key)
+            if credentials and credentials['Expiration'] - datetime.now(timezone.utc) > REMOTE_CREDENTIALS_MIN_VALIDITY:
+                return credentials
         base_session = cls.get_session()
         if role:
             log.info(f"Remote boto3 session using role={role} for account={accountid}")
@@ -211,8 +256,10 @@ class SessionHelper:
         else:
             log.info(f"Remote boto3 session using pivot role for account= {accountid}")
             role_arn = cls.get_delegation_role_arn(accountid=accountid)
-        session = SessionHelper.get_session(base_session=base_session, role_arn=role_arn)
-        return session
+        credentials = cls._assume_role(base_session=base_session, role_arn=role_arn)
+        with _remote_credentials_lock:
+            _remote_credentials[key] = credentials
+        return credentials
 
     @classmethod
     def get_account(cls, session=None):
@@ -224,7 +271,17 @@ class SessionHelper:
                 or the default boto3 session is not session argument was provided
         """
         if not session:
-            session = cls.get_session()
+            return cls._get_central_account()
+        return cls._get_caller_account(session)
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _get_central_account(cls):
+        """Returns the aws account id of the default session, which does not change for the process lifetime"""
+        return cls._get_caller_account(cls.get_session())
+
+    @staticmethod
+    def _get_caller_account(session):
         region = os.getenv('AWS_REGION', 'eu-west-1')
         client = session.client(
             'sts',
@@ -144,7 +144,8 @@ def deploy_cdk_stack(engine: Engine, stackid: str, app_path: str = None, path: s
             ]
 
             if stack.stack == 'cdkpipeline':
-                aws = SessionHelper.remote_session(stack.accountid)
+                # credentials are handed to the cdk subprocess, get a fresh set instead of cached ones
+                aws = SessionHelper.remote_session(stack.accountid, use_cache=False)
                 creds = aws.get_credentials()
                 env.update(
                     {
@@ -2,6 +2,9 @@ import logging
 import os
 import sys
 import subprocess
+from pathlib import Path
+from string import Template
+
 import boto3
 
 from ... import db
@@ -11,6 +14,48 @@ from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+BLUEPRINT_DIR = os.path.realpath(
+    os.path.join(os.path.dirname(__file__), "..", "blueprints", "data_pipeline_blueprint")
+)
+
+DDK_APP_TEMPLATE = Template("""
+# !/usr/bin/env python3
+
+import aws_cdk as cdk
+from aws_ddk_core.cicd import CICDPipelineStack
+from ddk_app.ddk_app_stack import DdkApplicationStack
+from aws_ddk_core.config import Config
+
+app = cdk.App()
+
+class ApplicationStage(cdk.Stage):
+    def __init__(
+            self,
+            scope,
+            environment_id: str,
+            **kwargs,
+    ) -> None:
+        super().__init__(scope, f"dataall-{environment_id.title()}", **kwargs)
+        DdkApplicationStack(self, "DataPipeline-$pipeline_label-$pipeline_uri", environment_id)
+
+id = f"dataall-cdkpipeline-$pipeline_uri"
+config = Config()
+(
+    CICDPipelineStack(
+        app,
+        id=id,
+        environment_id="cicd",
+        pipeline_name="$pipeline_label",
+    )
+        .add_source_action(repository_name="$pipeline_repo")
+        .add_synth_action()
+        .build()$stages
+        .synth()
+)
+
+app.synth()
+""")
+
 
 class CDKPipelineStack:
     """
@@ -51,13 +96,7 @@ class CDKPipelineStack:
             repository = CDKPipelineStack._check_repository(codecommit_client, self.pipeline.repo)
             if repository:
                 self.venv_name = None
-                self.code_dir_path = os.path.realpath(
-                    os.path.abspath(
-                        os.path.join(
-                            __file__, "..", "..", "blueprints", "data_pipeline_blueprint"
-                        )
-                    )
-                )
+                self.code_dir_path = BLUEPRINT_DIR
                 CDKPipelineStack.write_ddk_json_multienvironment(path=self.code_dir_path, output_file="ddk.json", pipeline_environment=self.pipeline_environment, development_environments=self.development_environments)
                 CDKPipelineStack.write_ddk_app_multienvironment(path=self.code_dir_path, output_file="app.py", pipeline=self.pipeline, development_environments=self.development_environments)
 
@@ -138,53 +177,18 @@ class CDKPipelineStack:
 
     @staticmethod
     def write_ddk_app_multienvironment(path, output_file, pipeline, development_environments):
-        header = f"""
-# !/usr/bin/env python3
-
-import aws_cdk as cdk
-from aws_ddk_core.cicd import CICDPipelineStack
-from ddk_app.ddk_app_stack import DdkApplicationStack
-from aws_ddk_core.config import Config
-
-app = cdk.App()
-
-class ApplicationStage(cdk.Stage):
-    def __init__(
-            self,
-            scope,
-            environment_id: str,
-            **kwargs,
-    ) -> None:
-        super().__init__(scope, f"dataall-{{environment_id.title()}}", **kwargs)
-        DdkApplicationStack(self, "DataPipeline-{pipeline.label}-{pipeline.DataPipelineUri}", environment_id)
-
-id = f"dataall-cdkpipeline-{pipeline.DataPipelineUri}"
-config = Config()
-(
-    CICDPipelineStack(
-        app,
-        id=id,
-        environment_id="cicd",
-        pipeline_name="{pipeline.label}",
-    )
-        .add_source_action(repository_name="{pipeline.repo}")
-        .add_synth_action()
-        .build()"""
-
         stages = ""
         for env in sorted(development_environments, key=lambda env: env.order):
             stage = f""".add_stage("{env.stage}", ApplicationStage(app, "{env.stage}", env=config.get_env("{env.stage}")))"""
             stages = stages + stage
-        footer = """
-        .synth()
-)
 
-app.synth()
-"""
-        app = header + stages + footer
-
-        with open(f'{path}/{output_file}', 'w') as text_file:
-            print(app, file=text_file)
+        app = DDK_APP_TEMPLATE.substitute(
+            pipeline_label=pipeline.label,
+            pipeline_uri=pipeline.DataPipelineUri,
+            pipeline_repo=pipeline.repo,
+            stages=stages,
+        )
+        Path(path, output_file).write_text(app)
 
     def git_push_repo(self):
         git_cmds = [
@@ -233,7 +237,7 @@ app.synth()
             )
 
             if process.returncode == 0:
-                print(f"Successfully cleaned cloned repo: {path}. {str(process.stdout)}")
+                logger.info("Successfully cleaned cloned repo: %s. %s", path, process.stdout)
             else:
                 logger.error(
                     f'Failed clean cloned repo: {path} due to {str(process.stderr)}'
@@ -257,7 +261,8 @@ app.synth()
 
     @staticmethod
     def _set_env_vars(pipeline_environment):
-        aws = SessionHelper.remote_session(pipeline_environment.AwsAccountId)
+        # credentials are handed to the ddk/git subprocesses, get a fresh set instead of cached ones
+        aws = SessionHelper.remote_session(pipeline_environment.AwsAccountId, use_cache=False)
         env_creds = aws.get_credentials()
 
         python_path = '/:'.join(sys.path)[1:] + ':/code' + os.getenv('PATH')
@@ -132,13 +132,14 @@ class EnvironmentSetup(Stack):
             )
 
     def __init__(self, scope, id, target_uri: str = None, **kwargs):
+        environment = self.get_target(target_uri=target_uri)
         super().__init__(
             scope,
             id,
             description='Cloud formation stack of ENVIRONMENT: {}; URI: {}; DESCRIPTION: {}'.format(
-                self.get_target(target_uri=target_uri).label,
+                environment.label,
                 target_uri,
-                self.get_target(target_uri=target_uri).description,
+                environment.description,
             )[:1024],
             **kwargs,
         )
@@ -155,7 +156,7 @@ class EnvironmentSetup(Stack):
         self.create_pivot_role = True if pivot_role_as_part_of_environment_stack == "True" else False
         self.engine = self.get_engine()
 
-        self._environment = self.get_target(target_uri=target_uri)
+        self._environment = environment
 
         self.environment_groups: [models.EnvironmentGroup] = self.get_environment_groups(
             self.engine, environment=self._environment
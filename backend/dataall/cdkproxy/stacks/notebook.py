@@ -47,20 +47,19 @@ class SagemakerNotebook(Stack):
         return env
 
     def __init__(self, scope, id: str, target_uri: str = None, **kwargs) -> None:
+        notebook = self.get_target(target_uri=target_uri)
         super().__init__(scope,
                          id,
                          description="Cloud formation stack of NOTEBOOK: {}; URI: {}; DESCRIPTION: {}".format(
-                             self.get_target(target_uri=target_uri).label,
+                             notebook.label,
                              target_uri,
-                             self.get_target(target_uri=target_uri).description,
+                             notebook.description,
                          )[:1024],
                          **kwargs)
 
         # Required for dynamic stack tagging
         self.target_uri = target_uri
 
-        notebook = self.get_target(target_uri=target_uri)
-
         env_group = self.get_env_group(notebook)
 
         cdk_exec_role = SessionHelper.get_cdk_exec_role_arn(notebook.AWSAccountId, notebook.region)
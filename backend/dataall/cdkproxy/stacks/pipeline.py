@@ -2,6 +2,9 @@ import logging
 import os
 import shutil
 import subprocess
+import textwrap
+import zipfile
+from functools import lru_cache
 from typing import List
 
 
@@ -26,6 +29,32 @@ from ...utils.runtime_stacks_tagging import TagsUtil
 
 logger = logging.getLogger(__name__)
 
+BLUEPRINT_DIR = os.path.realpath(
+    os.path.join(os.path.dirname(__file__), "..", "blueprints", "data_pipeline_blueprint")
+)
+
+DEPLOY_BUILDSPEC = textwrap.dedent("""
+    version: '0.2'
+    env:
+        git-credential-helper: yes
+    phases:
+      pre_build:
+        commands:
+        - n 16.15.1
+        - npm install -g aws-cdk
+        - pip install aws-ddk
+        - pip install -r requirements.txt
+      build:
+        commands:
+            - aws sts get-caller-identity
+            - ddk deploy
+""")
+
+
+@lru_cache(maxsize=4)
+def _engine_for(envname):
+    return db.get_engine(envname=envname)
+
 
 @stack("pipeline")
 class PipelineStack(Stack):
@@ -47,38 +76,33 @@ class PipelineStack(Stack):
     module_name = __file__
 
     def get_engine(self):
-        envname = os.environ.get("envname", "local")
-        engine = db.get_engine(envname=envname)
-        return engine
+        return _engine_for(os.environ.get("envname", "local"))
 
-    def get_target(self, target_uri) -> models.DataPipeline:
-        engine = self.get_engine()
-        with engine.scoped_session() as session:
-            return Pipeline.get_pipeline_by_uri(session, target_uri)
+    def get_target(self, session, target_uri) -> models.DataPipeline:
+        return Pipeline.get_pipeline_by_uri(session, target_uri)
 
-    def get_pipeline_environments(self, targer_uri) -> models.DataPipelineEnvironment:
-        engine = self.get_engine()
-        with engine.scoped_session() as session:
-            envs = Pipeline.query_pipeline_environments(
-                session, targer_uri
-            )
-        return envs
+    def get_pipeline_environments(self, session, target_uri) -> models.DataPipelineEnvironment:
+        return Pipeline.query_pipeline_environments(session, target_uri)
 
     def get_pipeline_cicd_environment(
-        self, pipeline: models.DataPipeline
+        self, session, pipeline: models.DataPipeline
     ) -> models.Environment:
-        envname = os.environ.get("envname", "local")
-        engine = db.get_engine(envname=envname)
-        with engine.scoped_session() as session:
-            return Environment.get_environment_by_uri(session, pipeline.environmentUri)
+        return Environment.get_environment_by_uri(session, pipeline.environmentUri)
+
+    def get_env_team(self, session, pipeline: models.DataPipeline) -> models.EnvironmentGroup:
+        return Environment.get_environment_group(
+            session, pipeline.SamlGroupName, pipeline.environmentUri
+        )
 
-    def get_env_team(self, pipeline: models.DataPipeline) -> models.EnvironmentGroup:
+    def _load_context(self, target_uri):
+        """Loads the pipeline and its related environments in a single database session"""
         engine = self.get_engine()
         with engine.scoped_session() as session:
-            env = Environment.get_environment_group(
-                session, pipeline.SamlGroupName, pipeline.environmentUri
-            )
-        return env
+            pipeline = self.get_target(session, target_uri)
+            pipeline_environment = self.get_pipeline_cicd_environment(session, pipeline)
+            pipeline_env_team = self.get_env_team(session, pipeline)
+            development_environments = self.get_pipeline_environments(session, target_uri)
+        return pipeline, pipeline_environment, pipeline_env_team, development_environments
 
     def get_dataset(self, dataset_uri) -> models.Dataset:
         engine = self.get_engine()
@@ -90,6 +114,12 @@ class PipelineStack(Stack):
 
     def __init__(self, scope, id, target_uri: str = None, **kwargs):
         kwargs.setdefault("tags", {}).update({"utility": "dataall-data-pipeline"})
+        (
+            pipeline,
+            pipeline_environment,
+            pipeline_env_team,
+            development_environments,
+        ) = self._load_context(target_uri)
         super().__init__(
             scope,
             id,
@@ -97,9 +127,9 @@ class PipelineStack(Stack):
             stack_name=kwargs.get("stack_name"),
             tags=kwargs.get("tags"),
             description="Cloud formation stack of PIPELINE: {}; URI: {}; DESCRIPTION: {}".format(
-                self.get_target(target_uri=target_uri).label,
+                pipeline.label,
                 target_uri,
-                self.get_target(target_uri=target_uri).description,
+                pipeline.description,
             )[
                 :1024
             ],
@@ -108,18 +138,11 @@ class PipelineStack(Stack):
         # Configuration
         self.target_uri = target_uri
 
-        pipeline = self.get_target(target_uri=target_uri)
-        pipeline_environment = self.get_pipeline_cicd_environment(pipeline=pipeline)
-        pipeline_env_team = self.get_env_team(pipeline=pipeline)
         # Development environments
-        development_environments = self.get_pipeline_environments(targer_uri=target_uri)
         self.devStages = [env.stage for env in development_environments]
 
         # Support resources
-        build_role_policy = iam.Policy(
-            self,
-            f"{pipeline.name}-policy",
-            policy_name=f"{pipeline.name}-policy",
+        build_role_policy_document = iam.PolicyDocument(
             statements=self.make_codebuild_policy_statements(
                 pipeline_environment=pipeline_environment,
                 pipeline_env_team=pipeline_env_team,
@@ -131,7 +154,7 @@ class PipelineStack(Stack):
             self,
             "PipelineRole",
             role_name=pipeline.name,
-            inline_policies={f"Inline{pipeline.name}": build_role_policy.document},
+            inline_policies={f"Inline{pipeline.name}": build_role_policy_document},
             assumed_by=iam.ServicePrincipal("codebuild.amazonaws.com"),
         )
 
@@ -177,13 +200,7 @@ class PipelineStack(Stack):
         )
 
         # Create CodeCommit repository and mirror blueprint code
-        code_dir_path = os.path.realpath(
-            os.path.abspath(
-                os.path.join(
-                    __file__, "..", "..", "blueprints", "data_pipeline_blueprint"
-                )
-            )
-        )
+        code_dir_path = BLUEPRINT_DIR
         logger.info(f"code directory path = {code_dir_path}")
         env_vars, aws = PipelineStack._set_env_vars(pipeline_environment)
         try:
@@ -391,17 +408,22 @@ class PipelineStack(Stack):
 
     @staticmethod
     def zip_directory(path):
+        archive_path = os.path.join(path, "code.zip")
         try:
-            shutil.make_archive("code", "zip", path)
-            shutil.move("code.zip", f"{path}/code.zip")
+            with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+                for root, _, files in os.walk(path):
+                    for file in files:
+                        file_path = os.path.join(root, file)
+                        if file_path != archive_path:
+                            archive.write(file_path, arcname=os.path.relpath(file_path, path))
         except Exception as e:
             logger.error(f"Failed to zip repository due to: {e}")
 
     @staticmethod
     def cleanup_zip_directory(path):
-        if os.path.isfile(f"{path}/code.zip"):
-            os.remove(f"{path}/code.zip")
-        else:
+        try:
+            os.unlink(f"{path}/code.zip")
+        except FileNotFoundError:
             logger.info("Info: %s Zip not found" % f"{path}/code.zip")
 
     @staticmethod
@@ -437,24 +459,8 @@ class PipelineStack(Stack):
 
     @staticmethod
     def write_deploy_buildspec(path, output_file):
-        yaml = """
-            version: '0.2'
-            env:
-                git-credential-helper: yes
-            phases:
-              pre_build:
-                commands:
-                - n 16.15.1
-                - npm install -g aws-cdk
-                - pip install aws-ddk
-                - pip install -r requirements.txt
-              build:
-                commands:
-                    - aws sts get-caller-identity
-                    - ddk deploy
-        """
         with open(f'{path}/{output_file}', 'x') as text_file:
-            print(yaml, file=text_file)
+            text_file.write(DEPLOY_BUILDSPEC)
 
     @staticmethod
     def make_codebuild_policy_statements(
@@ -547,7 +553,8 @@ class PipelineStack(Stack):
 
     @staticmethod
     def _set_env_vars(pipeline_environment):
-        aws = SessionHelper.remote_session(pipeline_environment.AwsAccountId)
+        # credentials are handed to the ddk/git subprocesses, get a fresh set instead of cached ones
+        aws = SessionHelper.remote_session(pipeline_environment.AwsAccountId, use_cache=False)
         env_creds = aws.get_credentials()
 
         env = {
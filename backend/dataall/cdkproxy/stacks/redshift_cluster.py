@@ -53,20 +53,19 @@ class RedshiftStack(Stack):
         return env
 
     def __init__(self, scope, id: str, target_uri: str = None, **kwargs) -> None:
+        cluster, environment = self.get_target(target_uri=target_uri)
         super().__init__(scope,
                          id,
                          description="Cloud formation stack of REDSHIFT CLUSTER: {}; URI: {}; DESCRIPTION: {}".format(
-                             self.get_target(target_uri=target_uri)[0].label,
+                             cluster.label,
                              target_uri,
-                             self.get_target(target_uri=target_uri)[0].description,
+                             cluster.description,
                          )[:1024],
                          **kwargs)
 
         # Required for dynamic stack tagging
         self.target_uri = target_uri
 
-        cluster, environment = self.get_target(target_uri=target_uri)
-
         env_group = self.get_env_group(cluster)
 
         if not cluster.imported:
@@ -258,22 +258,21 @@ class SagemakerStudioUserProfile(Stack):
         return env
 
     def __init__(self, scope, id: str, target_uri: str = None, **kwargs) -> None:
+        sm_user_profile: models.SagemakerStudioUserProfile = self.get_target(
+            target_uri=target_uri
+        )
         super().__init__(scope,
                          id,
                          description="Cloud formation stack of SM STUDIO PROFILE: {}; URI: {}; DESCRIPTION: {}".format(
-                             self.get_target(target_uri=target_uri).label,
+                             sm_user_profile.label,
                              target_uri,
-                             self.get_target(target_uri=target_uri).description,
+                             sm_user_profile.description,
                          )[:1024],
                          **kwargs)
 
         # Required for dynamic stack tagging
         self.target_uri = target_uri
 
-        sm_user_profile: models.SagemakerStudioUserProfile = self.get_target(
-            target_uri=self.target_uri
-        )
-
         env_group = self.get_env_group(sm_user_profile)
 
         # SageMaker Studio User Profile
@@ -746,7 +746,6 @@ class Environment:
                 )
             )
         if filter and filter.get('groupUri'):
-            print("filter group")
             group = filter['groupUri']
             query = query.filter(
                 or_(
@@ -25,6 +25,20 @@ class Permission:
             )
             return permission
 
+    @staticmethod
+    def find_permissions_by_names(
+        session, permission_names: [str], permission_type: str
+    ) -> [models.Permission]:
+        """Returns the permissions in the order of permission_names, None for the ones not found"""
+        found = {
+            permission.name: permission
+            for permission in session.query(models.Permission).filter(
+                models.Permission.name.in_(permission_names),
+                models.Permission.type == permission_type,
+            )
+        }
+        return [found.get(name) for name in permission_names]
+
     @staticmethod
     def get_permission_by_name(
         session, permission_name: str, permission_type: str
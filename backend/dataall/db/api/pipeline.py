@@ -339,7 +339,6 @@ class Pipeline:
         if data:
             if isinstance(data, dict):
                 for k in data.keys():
-                    print(f"KEY: {k}, VALUE: {data.get(k)}")
                     setattr(pipeline_env, k, data.get(k))
         return pipeline_env
 
@@ -334,16 +334,11 @@ class TenantPolicy:
                 action='LIST_TENANT_TEAM_PERMISSIONS',
                 message=f'User: {username} is not allowed to manage tenant permissions',
             )
-        group_invitation_permissions = []
-        for p in permissions.TENANT_ALL:
-            group_invitation_permissions.append(
-                Permission.find_permission_by_name(
-                    session=session,
-                    permission_name=p,
-                    permission_type=PermissionType.TENANT.name,
-                )
-            )
-        return group_invitation_permissions
+        return Permission.find_permissions_by_names(
+            session=session,
+            permission_names=permissions.TENANT_ALL,
+            permission_type=PermissionType.TENANT.name,
+        )
 
     @staticmethod
     def update_group_permissions(
@@ -384,16 +379,11 @@ class TenantPolicy:
                 tenant_name=tenant_name,
             )
 
-        tenant_group_permissions = []
-        for p in g_permissions:
-            tenant_group_permissions.append(
-                Permission.find_permission_by_name(
-                    session=session,
-                    permission_name=p,
-                    permission_type=PermissionType.TENANT.name,
-                )
-            )
-        return tenant_group_permissions
+        return Permission.find_permissions_by_names(
+            session=session,
+            permission_names=g_permissions,
+            permission_type=PermissionType.TENANT.name,
+        )
 
     @staticmethod
     def validate_params(data):
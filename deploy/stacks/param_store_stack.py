@@ -1,4 +1,4 @@
-import random
+import secrets
 import string
 
 import boto3
@@ -9,6 +9,8 @@ from aws_cdk import (
 
 from .pyNestedStack import pyNestedClass
 
+_EXTERNAL_ID_CHARS = string.ascii_letters + string.digits
+
 
 class ParamStoreStack(pyNestedClass):
     def __init__(
@@ -27,92 +29,106 @@ class ParamStoreStack(pyNestedClass):
     ):
         super().__init__(scope, id, **kwargs)
 
-        self.resource_prefix_param = aws_ssm.StringParameter(
-            self,
-            f'ResourcePrefixParam{envname}',
-            parameter_name=f'/dataall/{envname}/resourcePrefix',
-            string_value=resource_prefix,
-        )
+        # (construct id, parameter name, value, description)
+        params = [
+            (
+                f'ResourcePrefixParam{envname}',
+                f'/dataall/{envname}/resourcePrefix',
+                resource_prefix,
+                None,
+            ),
+        ]
 
         if custom_domain:
             custom_domain = custom_domain['hosted_zone_name']
             frontend_alternate_domain = custom_domain
             userguide_alternate_domain = 'userguide.' + custom_domain
 
-            aws_ssm.StringParameter(
-                self,
-                f'FrontendCustomDomain{envname}',
-                parameter_name=f'/dataall/{envname}/frontend/custom_domain_name',
-                string_value=frontend_alternate_domain,
-            )
-
-            aws_ssm.StringParameter(
-                self,
-                f'UserGuideCustomDomain{envname}',
-                parameter_name=f'/dataall/{envname}/userguide/custom_domain_name',
-                string_value=userguide_alternate_domain,
-            )
+            params += [
+                (
+                    f'FrontendCustomDomain{envname}',
+                    f'/dataall/{envname}/frontend/custom_domain_name',
+                    frontend_alternate_domain,
+                    None,
+                ),
+                (
+                    f'UserGuideCustomDomain{envname}',
+                    f'/dataall/{envname}/userguide/custom_domain_name',
+                    userguide_alternate_domain,
+                    None,
+                ),
+            ]
 
         if enable_cw_canaries:
-            aws_ssm.StringParameter(
-                self,
-                f'CWCanariesEnv{envname}',
-                parameter_name=f'/dataall/{envname}/canary/environment_account',
-                string_value='updateme(e.g: 1234xxxx)',
-            )
-            aws_ssm.StringParameter(
-                self,
-                f'CWCanariesRegion{envname}',
-                parameter_name=f'/dataall/{envname}/canary/environment_region',
-                string_value='updateme(e.g: eu-west-1)',
-            )
+            params += [
+                (
+                    f'CWCanariesEnv{envname}',
+                    f'/dataall/{envname}/canary/environment_account',
+                    'updateme(e.g: 1234xxxx)',
+                    None,
+                ),
+                (
+                    f'CWCanariesRegion{envname}',
+                    f'/dataall/{envname}/canary/environment_region',
+                    'updateme(e.g: eu-west-1)',
+                    None,
+                ),
+            ]
 
         if quicksight_enabled:
-            aws_ssm.StringParameter(
-                self,
-                f'QSVPCConnectionIdEnv{envname}',
-                parameter_name=f'/dataall/{envname}/quicksightmonitoring/VPCConnectionId',
-                string_value='updateme',
-            )
-            aws_ssm.StringParameter(
-                self,
-                f'QSDashboardIdEnv{envname}',
-                parameter_name=f'/dataall/{envname}/quicksightmonitoring/DashboardId',
-                string_value='updateme',
-            )
-
-        aws_ssm.StringParameter(
-            self,
-            f'dataallQuicksightConfiguration{envname}',
-            parameter_name=f"/dataall/{envname}/quicksight/sharedDashboardsSessions",
-            string_value=shared_dashboard_sessions,
-        )
-
-        aws_ssm.StringParameter(
-            self,
-            f'dataallCreationPivotRole{envname}',
-            parameter_name=f"/dataall/{envname}/pivotRole/enablePivotRoleAutoCreate",
-            string_value=str(enable_pivot_role_auto_create),
-        )
-
-        aws_ssm.StringParameter(
-            self,
-            f'dataallPivotRoleName{envname}',
-            parameter_name=f"/dataall/{envname}/pivotRole/pivotRoleName",
-            string_value=str(pivot_role_name),
-            description=f"Stores dataall pivot role name for environment {envname}",
-        )
+            params += [
+                (
+                    f'QSVPCConnectionIdEnv{envname}',
+                    f'/dataall/{envname}/quicksightmonitoring/VPCConnectionId',
+                    'updateme',
+                    None,
+                ),
+                (
+                    f'QSDashboardIdEnv{envname}',
+                    f'/dataall/{envname}/quicksightmonitoring/DashboardId',
+                    'updateme',
+                    None,
+                ),
+            ]
 
         existing_external_id = _get_external_id_value(envname=envname, account_id=self.account, region=self.region)
         external_id_value = existing_external_id if existing_external_id else _generate_external_id()
 
-        aws_ssm.StringParameter(
-            self,
-            f'dataallExternalId{envname}',
-            parameter_name=f"/dataall/{envname}/pivotRole/externalId",
-            string_value=str(external_id_value),
-            description=f"Stores dataall external id for environment {envname}",
-        )
+        params += [
+            (
+                f'dataallQuicksightConfiguration{envname}',
+                f"/dataall/{envname}/quicksight/sharedDashboardsSessions",
+                shared_dashboard_sessions,
+                None,
+            ),
+            (
+                f'dataallCreationPivotRole{envname}',
+                f"/dataall/{envname}/pivotRole/enablePivotRoleAutoCreate",
+                str(enable_pivot_role_auto_create),
+                None,
+            ),
+            (
+                f'dataallPivotRoleName{envname}',
+                f"/dataall/{envname}/pivotRole/pivotRoleName",
+                str(pivot_role_name),
+                f"Stores dataall pivot role name for environment {envname}",
+            ),
+            (
+                f'dataallExternalId{envname}',
+                f"/dataall/{envname}/pivotRole/externalId",
+                str(external_id_value),
+                f"Stores dataall external id for environment {envname}",
+            ),
+        ]
+
+        for construct_id, parameter_name, string_value, description in params:
+            aws_ssm.StringParameter(
+                self,
+                construct_id,
+                parameter_name=parameter_name,
+                string_value=string_value,
+                description=description,
+            )
 
 def _get_external_id_value(envname, account_id, region):
     """For first deployments it returns False,
@@ -155,5 +171,4 @@ def _get_external_id_value(envname, account_id, region):
             return False
 
 def _generate_external_id():
-    allowed_chars = string.ascii_uppercase + string.ascii_lowercase + string.digits
-    return ''.join(random.choice(allowed_chars) for i in range(32))
\ No newline at end of file
+    return ''.join(secrets.choice(_EXTERNAL_ID_CHARS) for _ in range(32))
\ No newline at end of file
@@ -1,3 +1,4 @@
+import json
 import typing
 
 import pytest
@@ -205,6 +206,32 @@ def test_start_crawler(org1, env1, dataset1, client, group, module_mocker):
     assert response.data.startGlueCrawler.Name == dataset1.GlueCrawlerName
 
 
+def test_get_dataset_presigned_url(dataset1, client, group, mocker):
+    presigned_post = {'url': 'https://bucket.s3.amazonaws.com/', 'fields': {'key': 'raw/file.csv'}}
+    get_presigned_post = mocker.patch(
+        'dataall.aws.handlers.s3.S3.get_presigned_post', return_value=presigned_post
+    )
+    response = client.query(
+        """
+        query GetDatasetPresignedUrl($datasetUri:String!, $input:DatasetPresignedUrlInput){
+            getDatasetPresignedUrl(datasetUri:$datasetUri, input:$input)
+        }
+        """,
+        datasetUri=dataset1.datasetUri,
+        username=dataset1.owner,
+        groups=[group.name],
+        input={'prefix': 'raw', 'fileName': 'file.csv'},
+    )
+    assert json.loads(response.data.getDatasetPresignedUrl) == presigned_post
+    get_presigned_post.assert_called_once_with(
+        account_id=dataset1.AwsAccountId,
+        region=dataset1.region,
+        bucket_name=dataset1.S3BucketName,
+        key='raw/file.csv',
+        expires_in=15 * 60,
+    )
+
+
 def test_update_dataset_unauthorized(dataset1, client, group):
     response = client.query(
         """
@@ -1,5 +1,24 @@
+import pytest
+
+import dataall
+from dataall.api.Objects.Tenant import resolvers as tenant_resolvers
 from dataall.db import permissions
 
+LIST_TENANT_PERMISSIONS = """
+    query listTenantPermissions{
+        listTenantPermissions{
+            name
+        }
+    }
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_tenant_cache():
+    tenant_resolvers._tenant_cache.clear()
+    yield
+    tenant_resolvers._tenant_cache.clear()
+
 
 def test_list_tenant_permissions(client, user, group, tenant):
     response = client.query(
@@ -98,3 +117,79 @@ def test_update_permissions(client, user, group, tenant):
     )
     print(response)
     assert response.data.updateGroupTenantPermissions
+
+
+def test_list_tenant_permissions_cached(client, user, group, tenant, mocker):
+    spy = mocker.spy(dataall.db.api.TenantPolicy, 'list_tenant_permissions')
+    for _ in range(2):
+        response = client.query(
+            LIST_TENANT_PERMISSIONS,
+            username=user.userName,
+            groups=[group.name, 'DAAdministrators'],
+        )
+        assert len(response.data.listTenantPermissions) >= 1
+    assert spy.call_count == 1
+
+    mocker.patch.object(tenant_resolvers, 'TENANT_CACHE_TTL_SECONDS', 0)
+    client.query(
+        LIST_TENANT_PERMISSIONS,
+        username=user.userName,
+        groups=[group.name, 'DAAdministrators'],
+    )
+    assert spy.call_count == 2
+
+
+def test_list_tenant_permissions_unauthorized_not_cached(client, user, group, tenant, mocker):
+    spy = mocker.spy(dataall.db.api.TenantPolicy, 'list_tenant_permissions')
+    for _ in range(2):
+        response = client.query(
+            LIST_TENANT_PERMISSIONS,
+            username=user.userName,
+            groups=[group.name],
+        )
+        assert 'UnauthorizedOperation' in response.errors[0].message
+    assert spy.call_count == 2
+    assert not tenant_resolvers._tenant_cache
+
+
+def test_update_permissions_clears_tenant_cache(client, user, group, tenant, mocker):
+    query = """
+        query listTenantGroups{
+            listTenantGroups{
+                nodes{
+                    groupUri
+                    tenantPermissions{
+                        name
+                    }
+                }
+            }
+        }
+    """
+    spy = mocker.spy(dataall.db.api.TenantPolicy, 'list_tenant_groups')
+    client.query(query, username=user.userName, groups=[group.name, 'DAAdministrators'])
+    assert tenant_resolvers._tenant_cache
+
+    response = client.query(
+        """
+        mutation updateGroupTenantPermissions($input:UpdateGroupTenantPermissionsInput!){
+            updateGroupTenantPermissions(input:$input)
+        }
+        """,
+        username='alice',
+        input=dict(
+            groupUri=group.name,
+            permissions=[permissions.MANAGE_ORGANIZATIONS],
+        ),
+        groups=[group.name, 'DAAdministrators'],
+    )
+    assert response.data.updateGroupTenantPermissions
+    assert not tenant_resolvers._tenant_cache
+
+    response = client.query(query, username=user.userName, groups=[group.name, 'DAAdministrators'])
+    assert spy.call_count == 2
+    node = next(
+        node for node in response.data.listTenantGroups.nodes if node.groupUri == group.name
+    )
+    names = [p.name for p in node.tenantPermissions]
+    assert permissions.MANAGE_ORGANIZATIONS in names
+    assert permissions.MANAGE_DATASETS not in names
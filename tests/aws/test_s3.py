@@ -0,0 +1,145 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import boto3
+import pytest
+
+from dataall.aws.handlers import s3
+from dataall.aws.handlers.s3 import S3
+from dataall.aws.handlers.sts import SessionHelper
+
+
+def make_credentials(expires_in: timedelta):
+    return {
+        'AccessKeyId': 'AKIA',
+        'SecretAccessKey': 'secret',
+        'SessionToken': 'token',
+        'Expiration': datetime.now(timezone.utc) + expires_in,
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_clients():
+    s3._clients.clear()
+    yield
+    s3._clients.clear()
+
+
+@pytest.fixture
+def remote_credentials(mocker):
+    return mocker.patch.object(
+        SessionHelper, 'remote_credentials', return_value=make_credentials(timedelta(hours=1))
+    )
+
+
+def test_client_cached_per_key(remote_credentials):
+    client = S3.client('111111111111', 'eu-west-1', 's3')
+    assert S3.client('111111111111', 'eu-west-1', 's3') is client
+    assert remote_credentials.call_count == 1
+
+    assert S3.client('222222222222', 'eu-west-1', 's3') is not client
+    assert S3.client('111111111111', 'us-east-1', 's3') is not client
+    assert S3.client('111111111111', 'eu-west-1', 'sts') is not client
+    assert S3.client('111111111111', 'eu-west-1', 's3', config=s3._PRESIGN_CONFIG) is not client
+    assert len(s3._clients) == 5
+
+
+def test_client_expires_before_credentials(remote_credentials):
+    credentials = remote_credentials.return_value
+    S3.client('111111111111', 'eu-west-1', 's3')
+    _, expires_at = s3._clients[('111111111111', 'eu-west-1', 's3', None)]
+    assert expires_at == (
+        credentials['Expiration'] - s3.PRESIGN_MAX_EXPIRES_IN - s3._CLIENT_CREDENTIALS_MARGIN
+    )
+
+
+def test_client_rebuilt_close_to_credentials_expiry(remote_credentials):
+    remote_credentials.return_value = make_credentials(timedelta(minutes=15))
+    client = S3.client('111111111111', 'eu-west-1', 's3')
+
+    remote_credentials.return_value = make_credentials(timedelta(hours=1))
+    assert S3.client('111111111111', 'eu-west-1', 's3') is not client
+    assert remote_credentials.call_count == 2
+
+
+def test_client_config_merged(remote_credentials):
+    client = S3.client('111111111111', 'eu-west-1', 's3', config=s3._PRESIGN_CONFIG)
+    assert client.meta.config.max_pool_connections == 50
+    assert client.meta.config.retries['mode'] == 'adaptive'
+    assert client.meta.config.signature_version == 's3v4'
+    assert client.meta.config.s3['addressing_style'] == 'virtual'
+
+
+def test_central_account_client(mocker):
+    get_session = mocker.patch.object(
+        SessionHelper, 'get_session', return_value=boto3.Session(region_name='eu-west-1')
+    )
+    client = S3.client(None, 'eu-west-1', 's3')
+    assert S3.client(None, 'eu-west-1', 's3') is client
+    assert get_session.call_count == 1
+    assert s3._clients[(None, 'eu-west-1', 's3', None)][1] is None
+
+
+def test_access_point_policy_template():
+    access_point_arn = 'arn:aws:s3:eu-west-1:111111111111:accesspoint/ap'
+    policy = S3.generate_access_point_policy_template('AROAEXAMPLE', access_point_arn, 'raw/sales')
+    assert json.dumps(policy) == json.dumps({
+        'Version': '2012-10-17',
+        'Statement': [
+            {
+                'Sid': 'AROAEXAMPLE0',
+                'Effect': 'Allow',
+                'Principal': {'AWS': '*'},
+                'Action': 's3:ListBucket',
+                'Resource': access_point_arn,
+                'Condition': {
+                    'StringLike': {
+                        's3:prefix': ['raw/sales/*'],
+                        'aws:userId': ['AROAEXAMPLE:*'],
+                    }
+                },
+            },
+            {
+                'Sid': 'AROAEXAMPLE1',
+                'Effect': 'Allow',
+                'Principal': {'AWS': '*'},
+                'Action': 's3:GetObject',
+                'Resource': [f'{access_point_arn}/object/raw/sales/*'],
+                'Condition': {'StringLike': {'aws:userId': ['AROAEXAMPLE:*']}},
+            },
+        ],
+    })
+
+
+def test_get_presigned_post(mocker):
+    s3_client = mocker.MagicMock()
+    s3_client.generate_presigned_post.return_value = {'url': 'https://bucket.s3.amazonaws.com/', 'fields': {}}
+    client = mocker.patch.object(S3, 'client', return_value=s3_client)
+
+    response = S3.get_presigned_post('111111111111', 'eu-west-1', 'bucket', 'raw/file.csv', 900)
+
+    assert response == s3_client.generate_presigned_post.return_value
+    client.assert_called_once_with(
+        account_id='111111111111', region='eu-west-1', client_type='s3', config=s3._PRESIGN_CONFIG
+    )
+    s3_client.get_bucket_acl.assert_called_once_with(Bucket='bucket', ExpectedBucketOwner='111111111111')
+    s3_client.generate_presigned_post.assert_called_once_with(
+        Bucket='bucket', Key='raw/file.csv', ExpiresIn=900
+    )
+
+
+def test_get_presigned_post_wrong_bucket_owner(mocker):
+    s3_client = mocker.MagicMock()
+    s3_client.get_bucket_acl.side_effect = Exception('AccessDenied')
+    mocker.patch.object(S3, 'client', return_value=s3_client)
+
+    with pytest.raises(Exception):
+        S3.get_presigned_post('111111111111', 'eu-west-1', 'bucket', 'raw/file.csv', 900)
+    s3_client.generate_presigned_post.assert_not_called()
+
+
+def test_get_presigned_post_expiry_too_long(mocker):
+    client = mocker.patch.object(S3, 'client')
+    with pytest.raises(ValueError):
+        S3.get_presigned_post('111111111111', 'eu-west-1', 'bucket', 'raw/file.csv', 3600)
+    client.assert_not_called()
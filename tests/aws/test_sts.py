@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from dataall.aws.handlers import sts
+from dataall.aws.handlers.sts import SessionHelper
+
+
+def make_credentials(expires_in: timedelta, key='AKIA'):
+    return {
+        'AccessKeyId': key,
+        'SecretAccessKey': 'secret',
+        'SessionToken': 'token',
+        'Expiration': datetime.now(timezone.utc) + expires_in,
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_remote_credentials():
+    sts._remote_credentials.clear()
+    yield
+    sts._remote_credentials.clear()
+
+
+@pytest.fixture
+def assume_role(mocker):
+    mocker.patch.object(SessionHelper, 'get_session', return_value=None)
+    mocker.patch.object(
+        SessionHelper,
+        'get_delegation_role_arn',
+        side_effect=lambda accountid: f'arn:aws:iam::{accountid}:role/pivotRole',
+    )
+    return mocker.patch.object(
+        SessionHelper, '_assume_role', return_value=make_credentials(timedelta(hours=1))
+    )
+
+
+def test_remote_credentials_cache_hit(assume_role):
+    first = SessionHelper.remote_credentials('111111111111')
+    second = SessionHelper.remote_credentials('111111111111')
+    assert first is second
+    assert assume_role.call_count == 1
+
+
+def test_remote_credentials_renewed_close_to_expiry(assume_role):
+    assume_role.return_value = make_credentials(
+        sts.REMOTE_CREDENTIALS_MIN_VALIDITY - timedelta(minutes=1), key='OLD'
+    )
+    assert SessionHelper.remote_credentials('111111111111')['AccessKeyId'] == 'OLD'
+
+    assume_role.return_value = make_credentials(timedelta(hours=1), key='NEW')
+    assert SessionHelper.remote_credentials('111111111111')['AccessKeyId'] == 'NEW'
+    assert assume_role.call_count == 2
+
+
+def test_remote_credentials_cached_per_account_and_role(assume_role):
+    SessionHelper.remote_credentials('111111111111')
+    SessionHelper.remote_credentials('111111111111', role='arn:aws:iam::111111111111:role/other')
+    SessionHelper.remote_credentials('222222222222')
+    assert assume_role.call_count == 3
+    assert [c.kwargs['role_arn'] for c in assume_role.call_args_list] == [
+        'arn:aws:iam::111111111111:role/pivotRole',
+        'arn:aws:iam::111111111111:role/other',
+        'arn:aws:iam::222222222222:role/pivotRole',
+    ]
+
+    SessionHelper.remote_credentials('111111111111', role='arn:aws:iam::111111111111:role/other')
+    assert assume_role.call_count == 3
+
+
+def test_remote_credentials_without_cache(assume_role):
+    SessionHelper.remote_credentials('111111111111')
+    SessionHelper.remote_credentials('111111111111', use_cache=False)
+    assert assume_role.call_count == 2
+
+
+def test_remote_session_returns_new_session_per_call(assume_role):
+    first = SessionHelper.remote_session('111111111111')
+    second = SessionHelper.remote_session('111111111111')
+    assert first is not second
+    assert first.get_credentials().access_key == 'AKIA'
+    assert assume_role.call_count == 1
@@ -1,5 +1,7 @@
 import json
 import os
+import zipfile
+
 import pytest
 from aws_cdk import App
 
@@ -62,4 +64,17 @@ def template2(pipeline2):
 def test_resources_created_cp_trunk(template2):
     assert 'AWS::CodeCommit::Repository' in template2
     assert 'AWS::CodePipeline::Pipeline' in template2
-    assert 'AWS::CodeBuild::Project' in template2
\ No newline at end of file
+    assert 'AWS::CodeBuild::Project' in template2
+
+
+def test_zip_directory(tmp_path):
+    (tmp_path / 'app.py').write_text('app')
+    (tmp_path / 'pipeline' / 'stages').mkdir(parents=True)
+    (tmp_path / 'pipeline' / 'stages' / 'stage.py').write_text('stage')
+    (tmp_path / 'code.zip').write_bytes(b'previous archive')
+
+    PipelineStack.zip_directory(str(tmp_path))
+
+    with zipfile.ZipFile(tmp_path / 'code.zip') as archive:
+        assert sorted(archive.namelist()) == ['app.py', 'pipeline/stages/stage.py']
+        assert archive.read('pipeline/stages/stage.py') == b'stage'
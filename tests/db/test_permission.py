@@ -266,3 +266,22 @@ def test_create_dataset(db, env, user, group, group_user, dataset, permissions,
             check_perm=True,
         )
         assert dataset
+
+
+def test_find_permissions_by_names(db, permissions):
+    with db.scoped_session() as session:
+        names = [
+            dataall.db.permissions.MANAGE_DATASETS,
+            'UNKNOWN_PERMISSION',
+            dataall.db.permissions.MANAGE_REDSHIFT_CLUSTERS,
+        ]
+        found = dataall.db.api.Permission.find_permissions_by_names(
+            session=session,
+            permission_names=names,
+            permission_type=PermissionType.TENANT.name,
+        )
+        assert [p.name if p else None for p in found] == [
+            dataall.db.permissions.MANAGE_DATASETS,
+            None,
+            dataall.db.permissions.MANAGE_REDSHIFT_CLUSTERS,
+        ]